@@ -1,16 +1,454 @@
 import os
+import time
 import httpx
+import asyncio
+import random
+import hashlib
+import tempfile
 import inspect
 import logging
 import polars as pl
+from pathlib import Path
+from typing import get_origin
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from mcp.server.fastmcp import FastMCP
 
-uw_token = os.getenv('UNUSUAL_WHALES_API_TOKEN')
-headers = {'Accept': 'application/json, text/plain', 'Authorization': uw_token}
-mcp = FastMCP('UnusualWhales', dependencies=['polars', 'httpx'])
+# Market time zone that timestamp columns are converted into
+_NY_TZ = 'America/New_York'
+
+# No Accept-Encoding here: httpx offers only the codecs it can decode, which
+# includes br and zstd when the brotli and zstd extras are installed
+headers = {'Accept': 'application/json, text/plain'}
+
+class _TokenAuth(httpx.Auth):
+    """
+    Attach the API token to each request. It is read from the environment when
+    a request is made, so the server starts without one and a missing token
+    fails before anything is sent.
+    """
+    def auth_flow(self, request: httpx.Request):
+        uw_token = os.getenv('UNUSUAL_WHALES_API_TOKEN')
+        if not uw_token:
+            raise ValueError('Missing API key: set the UNUSUAL_WHALES_API_TOKEN environment variable')
+        if not uw_token.startswith('Bearer '):
+            uw_token = f'Bearer {uw_token}'
+        request.headers['Authorization'] = uw_token
+        yield request
+
+# Shared client so successive tool calls reuse pooled connections and TLS sessions
+_limits = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60.0)
+
+_aclient: httpx.AsyncClient | None = None
+
+# Number of MCP sessions currently running; the client is closed when the last one ends
+_sessions = 0
+
+def _client() -> httpx.AsyncClient:
+    """
+    Return the shared async client, creating it on first use or after the last
+    session closed it.
+    """
+    global _aclient
+    if _aclient is None or _aclient.is_closed:
+        _aclient = httpx.AsyncClient(
+            base_url='https://api.unusualwhales.com',
+            headers=headers,
+            auth=_TokenAuth(),
+            timeout=30.0,
+            # Only makes httpx check up front that h2 is installed; the transport below negotiates HTTP/2
+            http2=True,
+            # Connection failures are retried by the transport itself
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=_limits, retries=2),
+        )
+    return _aclient
+
+# Rate-limited (429) and unavailable (503) responses are retried with backoff
+_RETRY_STATUSES = (429, 503)
+_MAX_RETRIES = 4
+_MAX_RETRY_DELAY = 30.0
+
+def _retry_delay(rsp: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a response: its Retry-After header if given
+    in seconds, otherwise exponential backoff. Jittered so concurrent calls spread out.
+    """
+    try:
+        delay = float(rsp.headers['Retry-After'])
+    except (KeyError, ValueError):
+        delay = 2 ** attempt
+    return min(delay, _MAX_RETRY_DELAY) + random.random() * 0.25
+
+async def _get(url: str, params: dict = None) -> httpx.Response:
+    """
+    GET an API path on the shared client, retrying rate-limited responses.
+    The last response is returned as-is once retries run out.
+    """
+    for attempt in range(_MAX_RETRIES):
+        rsp = await _client().get(url, params=params)
+        if rsp.status_code not in _RETRY_STATUSES:
+            return rsp
+        await asyncio.sleep(_retry_delay(rsp, attempt))
+    return await _client().get(url, params=params)
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Close the shared async client when the last MCP session shuts down.
+    FastMCP enters this once per session (e.g. per SSE connection), so it
+    must not close the client while other sessions are still using it.
+    """
+    global _sessions
+    _sessions += 1
+    try:
+        yield
+    finally:
+        _sessions -= 1
+        if not _sessions and _aclient is not None:
+            await _aclient.aclose()
+
+mcp = FastMCP('UnusualWhales', dependencies=['polars', 'httpx[brotli,http2,zstd]'], lifespan=_lifespan)
+
+# Keep categorical encodings consistent across calls so frames can be joined or concatenated
+pl.enable_string_cache()
+
+# On-disk response cache, one Parquet file per (endpoint, params) plus a sidecar
+# holding its expiry time. Set UW_CACHE_DISABLE to bypass it entirely.
+_CACHE_DIR = Path.home() / '.uw_mcp_cache'
+_CACHE_DISABLED = bool(os.getenv('UW_CACHE_DISABLE'))
+_CACHE_TTLS = {
+    'flow_alerts': 30,
+    'ticker_info': 24 * 60 * 60,
+    'stock_state': 60,
+    'institution_holdings': 24 * 60 * 60,
+    'insider_transactions': 60 * 60,
+    'congress_trades': 60 * 60,
+    'news_headlines': 5 * 60,
+}
+# Expired entries are swept from disk at most this often (seconds)
+_CACHE_SWEEP_INTERVAL = 10 * 60
+_last_sweep = 0.0
+# Misses (404s) are cached briefly, so retrying unknown tickers doesn't hit the API each time
+_NOT_FOUND_TTL = 60
+
+def _cache_key(url: str, params: dict = None) -> str:
+    """
+    Hash a request URL and its query params into a cache key.
+    """
+    return hashlib.md5((url + repr(sorted((params or {}).items()))).encode()).hexdigest()
+
+def _cache_get(endpoint: str, key: str) -> pl.DataFrame | None:
+    """
+    Return the cached DataFrame for a key, or None if it is missing or expired.
+    """
+    if _CACHE_DISABLED:
+        return None
+    path = _CACHE_DIR / endpoint / f'{key}.parquet'
+    try:
+        if time.time() >= float(path.with_suffix('.ts').read_text()):
+            _cache_evict(path)
+            return None
+        return pl.read_parquet(path)
+    except (OSError, ValueError, pl.exceptions.PolarsError):
+        return None
+
+def _cache_evict(path: Path) -> None:
+    """
+    Delete a cache entry's Parquet file and its expiry sidecar.
+    """
+    for p in (path, path.with_suffix('.ts')):
+        try:
+            p.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def _cache_sweep() -> None:
+    """
+    Delete every expired entry (and any leftover temp file) under the cache
+    directory, so queries that are never repeated don't pile up on disk.
+    Runs at most once per _CACHE_SWEEP_INTERVAL.
+    """
+    global _last_sweep
+    now = time.time()
+    if now - _last_sweep < _CACHE_SWEEP_INTERVAL:
+        return
+    _last_sweep = now
+    for ts in _CACHE_DIR.glob('*/*.ts'):
+        try:
+            if now >= float(ts.read_text()):
+                _cache_evict(ts.with_suffix('.parquet'))
+        except (OSError, ValueError):
+            _cache_evict(ts.with_suffix('.parquet'))
+    # Temp files and sidecar-less Parquet files are leftovers of interrupted writes
+    for stray in (*_CACHE_DIR.glob('*/*.tmp'), *_CACHE_DIR.glob('*/*.parquet')):
+        try:
+            if stray.suffix == '.parquet' and stray.with_suffix('.ts').exists():
+                continue
+            if now - stray.stat().st_mtime > _CACHE_SWEEP_INTERVAL:
+                stray.unlink()
+        except OSError:
+            pass
+
+def _cache_put(endpoint: str, key: str, df: pl.DataFrame, ttl: float = None) -> None:
+    """
+    Store a DataFrame in the cache, expiring after `ttl` seconds or the
+    endpoint's TTL if not given. Files are written to a temp name and moved
+    into place, so a failed write never leaves a partial entry behind.
+    """
+    if _CACHE_DISABLED:
+        return
+    _cache_sweep()
+    path = _CACHE_DIR / endpoint / f'{key}.parquet'
+    tmps = []
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(2):
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            os.close(fd)
+            tmps.append(tmp)
+        df.write_parquet(tmps[0])
+        Path(tmps[1]).write_text(str(time.time() + (ttl or _CACHE_TTLS[endpoint])))
+        os.replace(tmps[0], path)
+        os.replace(tmps[1], path.with_suffix('.ts'))
+    except (OSError, pl.exceptions.PolarsError) as e:
+        # Some frames (e.g. empty struct columns) can't be stored as Parquet
+        logging.warning(f"Could not write cache entry {path}: {e}")
+        for tmp in tmps:
+            Path(tmp).unlink(missing_ok=True)
+
+_NO_DEFAULT = object()
+
+def _signature_defaults(fn, drop: tuple = ()) -> tuple:
+    """
+    Describe each of a tool's query parameters as (name, query key, default),
+    with _NO_DEFAULT for required ones. Names in `drop` (e.g. path params) are
+    left out. Computed once per tool at import.
+    """
+    return tuple(
+        (
+            name,
+            # The API takes array params as repeated 'name[]' keys, which httpx
+            # produces from a list value
+            f'{name}[]' if get_origin(param.annotation) is list else name,
+            param.default if param.default is not param.empty else _NO_DEFAULT,
+        )
+        for name, param in inspect.signature(fn).parameters.items()
+        if name not in drop
+    )
+
+def _nondefault(args: dict, defaults: tuple) -> dict:
+    """
+    Build query params from a tool's arguments, keeping only those that are set
+    and differ from their default.
+    """
+    # The identity check skips __eq__ for untouched singleton defaults
+    # (False, None, small ints), while != still catches e.g. a passed 0.0.
+    return {
+        key: args[name]
+        for name, key, default in defaults
+        if args[name] is not None
+        and args[name] is not default
+        and args[name] != default
+    }
+
+def _read_data(payload: bytes) -> pl.DataFrame:
+    """
+    Parse the 'data' member of a raw API response body straight into a Polars
+    DataFrame. Handles both a list of records and a single record.
+    """
+    body = pl.read_json(payload)
+    if 'data' not in body.columns:
+        return pl.DataFrame()
+    data = body.get_column('data')
+    if isinstance(data.dtype, pl.List):
+        if not data.list.len().item():
+            return pl.DataFrame()
+        data = data.explode()
+    if not isinstance(data.dtype, pl.Struct) or not data.dtype.fields:
+        return pl.DataFrame()
+    return data.struct.unnest()
+
+def _select_columns(df: pl.DataFrame, columns: list[str] = None) -> pl.DataFrame:
+    """
+    Trim a tool's result down to the requested columns, if any were given.
+    Names the result doesn't have (e.g. optional fields, or an empty result)
+    are skipped, so the outcome doesn't depend on whether rows came back.
+    """
+    if not columns:
+        return df
+    return df.select(c for c in dict.fromkeys(columns) if c in df.columns)
+
+def _cast_exprs(dtypes: dict, tz_cols: tuple = (), strict: bool = True) -> dict[str, pl.Expr]:
+    """
+    Build one cast expression per column from a dtype map. Columns in `tz_cols`
+    are also converted to New York time within the same expression, so the
+    whole conversion runs as a single with_columns pass. Called once per
+    endpoint at import, so tools reuse the same expressions on every call.
+    """
+    exprs = {}
+    for name, dtype in dtypes.items():
+        expr = pl.col(name).cast(dtype, strict=strict)
+        if name in tz_cols:
+            expr = expr.dt.convert_time_zone(_NY_TZ)
+        exprs[name] = expr
+    return exprs
+
+async def _fetch_bytes(url: str, params: dict = None, missing_ok: bool = False) -> bytes | None:
+    """
+    Fetch a raw API response body, without any JSON or Polars processing, and
+    translate HTTP errors. With `missing_ok`, a 404 returns None instead of raising.
+    """
+    try:
+        rsp = await _get(url, params=params)
+        rsp.raise_for_status()
+        return rsp.content
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            raise ValueError('Invalid or missing API key')
+        elif e.response.status_code == 404:
+            if missing_ok:
+                logging.warning(f"Nothing found at {url}. Returning empty DataFrame.")
+                return None
+            raise ValueError(f'Resource not found: {e.response.text}')
+        elif e.response.status_code == 429:
+            raise ValueError('Rate limit exceeded')
+        else:
+            raise ValueError(f'HTTP error: {e.response.status_code} - {e.response.text}')
+
+    except httpx.TimeoutException:
+        raise TimeoutError('Request timed out')
+
+    except httpx.RequestError as e:
+        raise ConnectionError(f'Network error: {e.request.url} - {str(e)}')
+
+def _to_frame(payload: bytes, casts: dict) -> pl.DataFrame:
+    """
+    Convert a raw API response body into a typed Polars DataFrame. Casts for
+    columns the response left out are skipped.
+    """
+    df = _read_data(payload) if payload else pl.DataFrame()
+    if df.is_empty():
+        return df
+    return df.with_columns(expr for name, expr in casts.items() if name in df.columns)
+
+async def _fetch(endpoint: str, url: str, casts: dict, params: dict = None, missing_ok: bool = False) -> pl.DataFrame:
+    """
+    Fetch an API path as a typed Polars DataFrame, going through the disk cache
+    for `endpoint`. Shared by every tool.
+    """
+    key = _cache_key(url, params)
+    # Cache reads and writes are blocking file I/O, so keep them off the event loop
+    df = await asyncio.to_thread(_cache_get, endpoint, key)
+    if df is not None:
+        return df
+
+    payload = await _fetch_bytes(url, params, missing_ok)
+    if payload is None:
+        df = pl.DataFrame()
+        await asyncio.to_thread(_cache_put, endpoint, key, df, _NOT_FOUND_TTL)
+        return df
+    try:
+        df = _to_frame(payload, casts)
+    except Exception as e: # Catch other potential errors during processing
+        logging.error(f"An unexpected error occurred fetching {url}: {e}")
+        raise
+    await asyncio.to_thread(_cache_put, endpoint, key, df)
+    return df
+
+# Upper bound on concurrent requests made by the batched *_many tools
+_BATCH_CONCURRENCY = 10
+
+async def _gather_tickers(tool, tickers: list[str]) -> pl.DataFrame:
+    """
+    Run a single-ticker tool for every ticker concurrently and stack the
+    results, tagging each row with the ticker it was fetched for.
+    """
+    sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def fetch(ticker: str) -> pl.DataFrame:
+        async with sem:
+            df = await tool(ticker)
+        if df.is_empty() or 'ticker' in df.columns:
+            return df
+        return df.select(pl.lit(ticker).alias('ticker'), pl.all())
+
+    frames = [df for df in await asyncio.gather(*(fetch(t) for t in tickers)) if not df.is_empty()]
+    if not frames:
+        return pl.DataFrame()
+    return pl.concat(frames, how='diagonal_relaxed')
+
+# Pages requested at once by the all_pages mode, and a cap on how far it goes
+_PAGE_CONCURRENCY = 5
+_MAX_PAGES = 100
+
+async def _fetch_pages(endpoint: str, url: str, casts: dict, params: dict, limit: int, missing_ok: bool = False) -> pl.DataFrame:
+    """
+    Fetch a paginated endpoint from the requested page onwards and stack the
+    pages. Later pages are requested concurrently in small batches, stopping
+    at the first page that comes back shorter than `limit`.
+    """
+    start = params.get('page', 0)
+    frames = [await _fetch(endpoint, url, casts, params, missing_ok)]
+    page = start + 1
+    while limit > 0 and frames[-1].height >= limit and page < start + _MAX_PAGES:
+        pages = range(page, min(page + _PAGE_CONCURRENCY, start + _MAX_PAGES))
+        batch = await asyncio.gather(*(_fetch(endpoint, url, casts, {**params, 'page': p}, missing_ok) for p in pages))
+        for df in batch:
+            frames.append(df)
+            if df.height < limit:
+                break
+        page = pages.stop
+
+    frames = [df for df in frames if not df.is_empty()]
+    if not frames:
+        return pl.DataFrame()
+    return pl.concat(frames, how='diagonal_relaxed')
+
+def _flow_alerts_impossible(params: dict) -> bool:
+    """
+    Detect Flow Alerts filter combinations that can never match anything, so
+    the request can be skipped entirely.
+    """
+    if params.get('limit') == 0:
+        return True
+    # A flow alert is for a single contract, which is either a call or a put
+    if params.get('is_call') and params.get('is_put'):
+        return True
+    for field in ('diff', 'dte', 'open_interest', 'premium', 'size', 'volume', 'volume_oi_ratio'):
+        low, high = params.get(f'min_{field}'), params.get(f'max_{field}')
+        if low is not None and high is not None and low > high:
+            return True
+    return False
+
+# Target dtypes for the Flow Alerts columns, applied in a single pass
+_FLOW_ALERTS_DTYPES = {
+    'created_at': pl.Datetime,
+    'expiry': pl.Date,
+    'next_earnings_date': pl.Date,
+    'total_ask_side_prem': pl.Int64,
+    'total_bid_side_prem': pl.Int64,
+    'total_premium': pl.Int64,
+    # Prices and IVs don't need exact decimals, so keep them as 8-byte floats
+    'ask': pl.Float64,
+    'bid': pl.Float64,
+    'iv_end': pl.Float64,
+    'iv_start': pl.Float64,
+    'price': pl.Float64,
+    'strike': pl.Float64,
+    'underlying_price': pl.Float64,
+    'volume_oi_ratio': pl.Float64,
+    'marketcap': pl.Decimal(24, 2),
+    # Low-cardinality strings are stored as categoricals
+    'alert_rule': pl.Categorical,
+    'issue_type': pl.Categorical,
+    'ticker': pl.Categorical,
+    'type': pl.Categorical,
+}
+_FLOW_ALERTS_CASTS = _cast_exprs(_FLOW_ALERTS_DTYPES, tz_cols=('created_at',))
 
 @mcp.tool()
-def get_flow_alerts(
+async def get_flow_alerts(
     all_opening: bool=False,
     is_ask_side: bool=False,
     is_bid_side: bool=False,
@@ -38,7 +476,8 @@ def get_flow_alerts(
     newer_than: str=None,
     older_than: str=None,
     rule_name: list[str]=None,
-    ticker_symbol: str=None
+    ticker_symbol: str=None,
+    columns: list[str]=None
 ) -> pl.DataFrame:
     """
     Fetch Flow Alerts from the Unusual Whales API using the input parameters
@@ -72,79 +511,26 @@ def get_flow_alerts(
         older_than (str): ISO 8601 formatted date string for filtering results
         rule_name (list[str]): List, allowed values are 'FloorTradeSmallCap', 'FloorTradeMidCap', 'RepeatHits', 'RepeatedHitsAscendingFill', 'RepeatedHitsDescendingFill', 'FloorTradeLargeCap', 'OtmEarningsFloor', 'LowHistoricVolumeFloor', 'SweepsFollowedByFloor'
         ticker_symbol (str): Ticker symbol, for only AAPL and INTC use 'AAPL,INTC' and to exclude AAPL and INTC use '-AAPL,INTC'
+        columns (list[str]): Optional list of columns to return, instead of all of them. Unknown names are skipped.
     """
-    url = 'https://api.unusualwhales.com/api/option-trades/flow-alerts'
-
-    default_values = get_flow_alerts.__defaults__
-    param_names = get_flow_alerts.__code__.co_varnames[:get_flow_alerts.__code__.co_argcount]
-    defaults = dict(zip(param_names, default_values))
-    
-    # Build query params, including only explicitly passed parameters
-    frame = inspect.currentframe()
-    args = frame.f_locals
-    params = {
-        name: args[name] 
-        for name in param_names 
-        if name in args
-        and (args[name] is not None)
-        and (name not in defaults or args[name] != defaults[name])
-        and name not in ('url', 'frame')
-    }
-    del frame
+    params = _nondefault(locals(), _FLOW_ALERTS_DEFAULTS)
+    if _flow_alerts_impossible(params):
+        return pl.DataFrame()
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            rsp = client.get(url, params=params, headers=headers)
-            rsp.raise_for_status()
-            
-            data = rsp.json()['data']
-            if not data:
-                return pl.DataFrame()
-            else:
-                df = pl.DataFrame(data)
-                return (
-                    df
-                    .with_columns(
-                        pl.col('created_at').cast(pl.Datetime),
-                        pl.col('expiry').cast(pl.Date),
-                        pl.col('next_earnings_date').cast(pl.Date),
-                        pl.col('total_ask_side_prem').cast(pl.Int64),
-                        pl.col('total_bid_side_prem').cast(pl.Int64),
-                        pl.col('total_premium').cast(pl.Int64),
-                        pl.col('ask').cast(pl.Decimal),
-                        pl.col('bid').cast(pl.Decimal),
-                        pl.col('iv_end').cast(pl.Decimal),
-                        pl.col('iv_start').cast(pl.Decimal),
-                        pl.col('marketcap').cast(pl.Decimal),
-                        pl.col('price').cast(pl.Decimal),
-                        pl.col('strike').cast(pl.Decimal),
-                        pl.col('underlying_price').cast(pl.Decimal),
-                        pl.col('volume_oi_ratio').cast(pl.Decimal),
-                    )
-                    .with_columns(
-                        pl.col('created_at').dt.convert_time_zone('America/New_York')
-                    )
-                )
+    df = await _fetch('flow_alerts', '/api/option-trades/flow-alerts', _FLOW_ALERTS_CASTS, params)
+    return _select_columns(df, columns)
 
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise ValueError('Invalid or missing API key')
-        elif e.response.status_code == 404:
-            raise ValueError(f'Resource not found: {e.response.text}')
-        elif e.response.status_code == 429:
-            raise ValueError('Rate limit exceeded')
-        else:
-            raise ValueError(f'HTTP error: {e.response.status_code} - {e.response.text}')
-    
-    except httpx.RequestError as e:
-        raise ConnectionError(f'Network error: {e.request.url} - {str(e)}')
-    
-    except httpx.TimeoutException:
-        raise TimeoutError('Request timed out')
+_FLOW_ALERTS_DEFAULTS = _signature_defaults(get_flow_alerts, drop=('columns',))
 
+_TICKER_INFO_DTYPES = {
+    'avg30_volume': pl.Int64,
+    'marketcap': pl.Decimal(24, 2),
+    'next_earnings_date': pl.Date,
+}
+_TICKER_INFO_CASTS = _cast_exprs(_TICKER_INFO_DTYPES, strict=False)
 
 @mcp.tool()
-def get_ticker_info(ticker: str) -> pl.DataFrame:
+async def get_ticker_info(ticker: str) -> pl.DataFrame:
     """
     Fetch general information about a given stock ticker from the Unusual Whales API.
     Args:
@@ -152,63 +538,22 @@ def get_ticker_info(ticker: str) -> pl.DataFrame:
     Returns:
         pl.DataFrame: A Polars DataFrame containing information about the ticker.
     """
-    url = f'https://api.unusualwhales.com/api/stock/{ticker}/info'
-    
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            rsp = client.get(url, headers=headers)
-            rsp.raise_for_status()
-            
-            data = rsp.json().get('data')
-            if not data:
-                return pl.DataFrame()
-            else:
-                # Ensure data is a list for DataFrame creation
-                if not isinstance(data, list):
-                    data = [data]
-                df = pl.DataFrame(data)
-                # Apply type conversions as needed based on expected schema
-                # Example conversions (adjust based on actual data structure):
-                if 'next_earnings_date' in df.columns:
-                     df = df.with_columns(pl.col('next_earnings_date').cast(pl.Date, strict=False))
-                if 'avg30_volume' in df.columns:
-                     df = df.with_columns(pl.col('avg30_volume').cast(pl.Int64, strict=False))
-                if 'marketcap' in df.columns:
-                     df = df.with_columns(pl.col('marketcap').cast(pl.Decimal, strict=False))
-
-                return df
+    url = f'/api/stock/{ticker}/info'
+    return await _fetch('ticker_info', url, _TICKER_INFO_CASTS, missing_ok=True)
 
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise ValueError('Invalid or missing API key')
-        elif e.response.status_code == 404:
-             # Check if the response body indicates 'not found' or is empty
-            try:
-                error_data = e.response.json()
-                if not error_data or error_data.get('message') == 'Not Found': # Adjust based on actual error response
-                     logging.warning(f"Ticker info not found for {ticker}. Returning empty DataFrame.")
-                     return pl.DataFrame() # Return empty DataFrame for 404
-                else:
-                     raise ValueError(f'Resource not found: {e.response.text}')
-            except Exception: # Fallback if response is not JSON or parsing fails
-                 logging.warning(f"Ticker info not found for {ticker} (non-JSON 404 response). Returning empty DataFrame.")
-                 return pl.DataFrame() # Return empty DataFrame for 404
-        elif e.response.status_code == 429:
-            raise ValueError('Rate limit exceeded')
-        else:
-            raise ValueError(f'HTTP error: {e.response.status_code} - {e.response.text}')
-    
-    except httpx.RequestError as e:
-        raise ConnectionError(f'Network error: {e.request.url} - {str(e)}')
-    
-    except httpx.TimeoutException:
-        raise TimeoutError('Request timed out')
-    except Exception as e: # Catch other potential errors during processing
-        logging.error(f"An unexpected error occurred in get_ticker_info for {ticker}: {e}")
-        raise
+_STOCK_STATE_DTYPES = {
+    'close': pl.Float64,
+    'high': pl.Float64,
+    'low': pl.Float64,
+    'open': pl.Float64,
+    'tape_time': pl.Datetime,
+    'total_volume': pl.Int64,
+    'volume': pl.Int64,
+}
+_STOCK_STATE_CASTS = _cast_exprs(_STOCK_STATE_DTYPES, tz_cols=('tape_time',), strict=False)
 
 @mcp.tool()
-def get_stock_state(ticker: str) -> pl.DataFrame:
+async def get_stock_state(ticker: str) -> pl.DataFrame:
     """
     Fetch the last stock state (OHLCV) for a given ticker from the Unusual Whales API.
     Args:
@@ -216,59 +561,47 @@ def get_stock_state(ticker: str) -> pl.DataFrame:
     Returns:
         pl.DataFrame: A Polars DataFrame containing the last stock state.
     """
-    url = f'https://api.unusualwhales.com/api/stock/{ticker}/stock-state'
-    
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            rsp = client.get(url, headers=headers)
-            rsp.raise_for_status()
-            
-            data = rsp.json().get('data')
-            if not data:
-                return pl.DataFrame()
-            else:
-                 # Ensure data is a list for DataFrame creation
-                if not isinstance(data, list):
-                    data = [data]
-                df = pl.DataFrame(data)
-                # Apply type conversions
-                return (
-                    df
-                    .with_columns(
-                        pl.col('close').cast(pl.Decimal, strict=False),
-                        pl.col('high').cast(pl.Decimal, strict=False),
-                        pl.col('low').cast(pl.Decimal, strict=False),
-                        pl.col('open').cast(pl.Decimal, strict=False),
-                        pl.col('tape_time').cast(pl.Datetime, strict=False),
-                        pl.col('total_volume').cast(pl.Int64, strict=False),
-                        pl.col('volume').cast(pl.Int64, strict=False),
-                    )
-                     .with_columns(
-                        pl.col('tape_time').dt.convert_time_zone('America/New_York')
-                    )
-                )
+    url = f'/api/stock/{ticker}/stock-state'
+    return await _fetch('stock_state', url, _STOCK_STATE_CASTS, missing_ok=True)
 
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise ValueError('Invalid or missing API key')
-        elif e.response.status_code == 404:
-            raise ValueError(f'Resource not found: {e.response.text}')
-        elif e.response.status_code == 429:
-            raise ValueError('Rate limit exceeded')
-        else:
-            raise ValueError(f'HTTP error: {e.response.status_code} - {e.response.text}')
-    
-    except httpx.RequestError as e:
-        raise ConnectionError(f'Network error: {e.request.url} - {str(e)}')
-    
-    except httpx.TimeoutException:
-        raise TimeoutError('Request timed out')
-    except Exception as e: # Catch other potential errors during processing
-        logging.error(f"An unexpected error occurred in get_stock_state for {ticker}: {e}")
-        raise
+@mcp.tool()
+async def get_ticker_info_many(tickers: list[str]) -> pl.DataFrame:
+    """
+    Fetch general information for several stock tickers concurrently from the Unusual Whales API.
+    Args:
+        tickers (list[str]): The stock ticker symbols (e.g., ['AAPL', 'MSFT']).
+    Returns:
+        pl.DataFrame: A Polars DataFrame with one row per ticker found.
+    """
+    return await _gather_tickers(get_ticker_info, tickers)
 
 @mcp.tool()
-def get_institution_holdings(
+async def get_stock_state_many(tickers: list[str]) -> pl.DataFrame:
+    """
+    Fetch the last stock state (OHLCV) for several tickers concurrently from the Unusual Whales API.
+    Args:
+        tickers (list[str]): The stock ticker symbols (e.g., ['AAPL', 'MSFT']).
+    Returns:
+        pl.DataFrame: A Polars DataFrame with one row per ticker, including a 'ticker' column.
+    """
+    return await _gather_tickers(get_stock_state, tickers)
+
+_INSTITUTION_HOLDINGS_DTYPES = {
+    'avg_price': pl.Float64,
+    'close': pl.Float64,
+    'date': pl.Date,
+    'first_buy': pl.Date,
+    # historical_units is array, handle appropriately if needed later
+    'price_first_buy': pl.Float64,
+    'shares_outstanding': pl.Float64,
+    'units': pl.Int64,
+    'units_change': pl.Int64,
+    'value': pl.Int64,
+}
+_INSTITUTION_HOLDINGS_CASTS = _cast_exprs(_INSTITUTION_HOLDINGS_DTYPES, strict=False)
+
+@mcp.tool()
+async def get_institution_holdings(
     name: str, 
     date: str = None, 
     start_date: str = None, 
@@ -277,7 +610,9 @@ def get_institution_holdings(
     limit: int = 500, 
     page: int = 0, 
     order: str = None, 
-    order_direction: str = 'desc'
+    order_direction: str = 'desc',
+    all_pages: bool = False,
+    columns: list[str] = None
 ) -> pl.DataFrame:
     """
     Fetch holdings for a given institution from the Unusual Whales API.
@@ -291,75 +626,41 @@ def get_institution_holdings(
         page (int): Page number for pagination (starts at 0).
         order (str): Optional column to order results by (e.g., 'ticker', 'value').
         order_direction (str): Sort order ('asc' or 'desc', default 'desc').
+        all_pages (bool): If True, fetch every page from `page` onwards concurrently and return them combined.
+        columns (list[str]): Optional list of columns to return, instead of all of them. Unknown names are skipped.
     Returns:
         pl.DataFrame: A Polars DataFrame containing the institution's holdings.
     """
-    url = f'https://api.unusualwhales.com/api/institution/{name}/holdings'
-    
-    default_values = get_institution_holdings.__defaults__
-    param_names = get_institution_holdings.__code__.co_varnames[:get_institution_holdings.__code__.co_argcount]
-    defaults = dict(zip(param_names, default_values))
-    
-    frame = inspect.currentframe()
-    args = frame.f_locals
-    params = {
-        p_name: args[p_name] 
-        for p_name in param_names 
-        if p_name in args
-        and (args[p_name] is not None)
-        and (p_name not in defaults or args[p_name] != defaults[p_name])
-        and p_name not in ('url', 'frame', 'name') # Exclude path param 'name'
-    }
-    del frame
+    url = f'/api/institution/{name}/holdings'
+    params = _nondefault(locals(), _INSTITUTION_HOLDINGS_DEFAULTS)
+    if all_pages:
+        df = await _fetch_pages('institution_holdings', url, _INSTITUTION_HOLDINGS_CASTS, params, limit, missing_ok=True)
+    else:
+        df = await _fetch('institution_holdings', url, _INSTITUTION_HOLDINGS_CASTS, params, missing_ok=True)
+    return _select_columns(df, columns)
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            rsp = client.get(url, params=params, headers=headers)
-            rsp.raise_for_status()
-            
-            data = rsp.json().get('data')
-            if not data:
-                return pl.DataFrame()
-            else:
-                df = pl.DataFrame(data)
-                # Apply type conversions based on the schema 'An Institution's Holdings'
-                return (
-                    df
-                    .with_columns(
-                        pl.col('avg_price').cast(pl.Decimal, strict=False).alias('avg_price'),
-                        pl.col('close').cast(pl.Decimal, strict=False).alias('close'),
-                        pl.col('date').cast(pl.Date, strict=False).alias('date'),
-                        pl.col('first_buy').cast(pl.Date, strict=False).alias('first_buy'),
-                        # historical_units is array, handle appropriately if needed later
-                        pl.col('price_first_buy').cast(pl.Decimal, strict=False).alias('price_first_buy'),
-                        pl.col('shares_outstanding').cast(pl.Decimal, strict=False).alias('shares_outstanding'),
-                        pl.col('units').cast(pl.Int64, strict=False).alias('units'),
-                        pl.col('units_change').cast(pl.Int64, strict=False).alias('units_change'),
-                        pl.col('value').cast(pl.Int64, strict=False).alias('value'),
-                    )
-                )
+_INSTITUTION_HOLDINGS_DEFAULTS = _signature_defaults(get_institution_holdings, drop=('name', 'all_pages', 'columns'))
 
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise ValueError('Invalid or missing API key')
-        elif e.response.status_code == 404:
-            raise ValueError(f'Resource not found for institution {name}: {e.response.text}')
-        elif e.response.status_code == 429:
-            raise ValueError('Rate limit exceeded')
-        else:
-            raise ValueError(f'HTTP error: {e.response.status_code} - {e.response.text}')
-    
-    except httpx.RequestError as e:
-        raise ConnectionError(f'Network error: {e.request.url} - {str(e)}')
-    
-    except httpx.TimeoutException:
-        raise TimeoutError('Request timed out')
-    except Exception as e: # Catch other potential errors during processing
-        logging.error(f"An unexpected error occurred in get_institution_holdings for {name}: {e}")
-        raise
+_INSIDER_TRANSACTIONS_DTYPES = {
+    'amount': pl.Int64,
+    'date_excercisable': pl.Date,
+    'expiration_date': pl.Date,
+    'filing_date': pl.Date,
+    # ids is array
+    'marketcap': pl.Decimal(24, 2),
+    'next_earnings_date': pl.Date,
+    'price': pl.Float64,
+    'price_excercisable': pl.Float64,
+    'shares_owned_after': pl.Int64,
+    'shares_owned_before': pl.Int64,
+    'stock_price': pl.Float64,
+    'transaction_date': pl.Date,
+    'transactions': pl.Int64,
+}
+_INSIDER_TRANSACTIONS_CASTS = _cast_exprs(_INSIDER_TRANSACTIONS_DTYPES, strict=False)
 
 @mcp.tool()
-def get_insider_transactions(
+async def get_insider_transactions(
     ticker_symbol: str = None,
     min_value: str = None,
     max_value: str = None,
@@ -383,7 +684,9 @@ def get_insider_transactions(
     transaction_codes: list[str] = None,
     security_ad_codes: str = None,
     limit: int = 500,
-    page: int = 0
+    page: int = 0,
+    all_pages: bool = False,
+    columns: list[str] = None
 ) -> pl.DataFrame:
     """
     Fetch insider transactions from the Unusual Whales API, aggregated by default.
@@ -412,155 +715,60 @@ def get_insider_transactions(
         security_ad_codes (str): Filter by security acquisition disposition codes (comma-separated).
         limit (int): Maximum number of results to return (default 500, max 500).
         page (int): Page number for pagination (starts at 0).
+        all_pages (bool): If True, fetch every page from `page` onwards concurrently and return them combined.
+        columns (list[str]): Optional list of columns to return, instead of all of them. Unknown names are skipped.
     Returns:
         pl.DataFrame: A Polars DataFrame containing insider transactions.
     """
-    url = 'https://api.unusualwhales.com/api/insider/transactions'
-    
-    default_values = get_insider_transactions.__defaults__
-    param_names = get_insider_transactions.__code__.co_varnames[:get_insider_transactions.__code__.co_argcount]
-    defaults = dict(zip(param_names, default_values))
-    
-    frame = inspect.currentframe()
-    args = frame.f_locals
-    params = {
-        p_name: args[p_name] 
-        for p_name in param_names 
-        if p_name in args
-        and (args[p_name] is not None)
-        and (p_name not in defaults or args[p_name] != defaults[p_name])
-        and p_name not in ('url', 'frame')
-    }
-    # Handle list parameters correctly for query string
-    if 'transaction_codes' in params and isinstance(params['transaction_codes'], list):
-        params['transaction_codes[]'] = params.pop('transaction_codes')
+    url = '/api/insider/transactions'
+    params = _nondefault(locals(), _INSIDER_TRANSACTIONS_DEFAULTS)
+    if all_pages:
+        df = await _fetch_pages('insider_transactions', url, _INSIDER_TRANSACTIONS_CASTS, params, limit)
+    else:
+        df = await _fetch('insider_transactions', url, _INSIDER_TRANSACTIONS_CASTS, params)
+    return _select_columns(df, columns)
 
-    del frame
+_INSIDER_TRANSACTIONS_DEFAULTS = _signature_defaults(get_insider_transactions, drop=('all_pages', 'columns'))
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            rsp = client.get(url, params=params, headers=headers)
-            rsp.raise_for_status()
-            
-            data = rsp.json().get('data')
-            if not data:
-                return pl.DataFrame()
-            else:
-                df = pl.DataFrame(data)
-                # Apply type conversions based on the schema 'Insider Trade Agg'
-                return (
-                    df
-                    .with_columns(
-                        pl.col('amount').cast(pl.Int64, strict=False),
-                        pl.col('date_excercisable').cast(pl.Date, strict=False),
-                        pl.col('expiration_date').cast(pl.Date, strict=False),
-                        pl.col('filing_date').cast(pl.Date, strict=False),
-                        # ids is array
-                        pl.col('marketcap').cast(pl.Decimal, strict=False),
-                        pl.col('next_earnings_date').cast(pl.Date, strict=False),
-                        pl.col('price').cast(pl.Decimal, strict=False),
-                        pl.col('price_excercisable').cast(pl.Decimal, strict=False),
-                        pl.col('shares_owned_after').cast(pl.Int64, strict=False),
-                        pl.col('shares_owned_before').cast(pl.Int64, strict=False),
-                        pl.col('stock_price').cast(pl.Decimal, strict=False), # Assuming stock_price is decimal
-                        pl.col('transaction_date').cast(pl.Date, strict=False),
-                        pl.col('transactions').cast(pl.Int64, strict=False),
-                    )
-                )
-
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise ValueError('Invalid or missing API key')
-        elif e.response.status_code == 404:
-            raise ValueError(f'Resource not found: {e.response.text}')
-        elif e.response.status_code == 429:
-            raise ValueError('Rate limit exceeded')
-        else:
-            raise ValueError(f'HTTP error: {e.response.status_code} - {e.response.text}')
-    
-    except httpx.RequestError as e:
-        raise ConnectionError(f'Network error: {e.request.url} - {str(e)}')
-    
-    except httpx.TimeoutException:
-        raise TimeoutError('Request timed out')
-    except Exception as e: # Catch other potential errors during processing
-        logging.error(f"An unexpected error occurred in get_insider_transactions: {e}")
-        raise
+_CONGRESS_TRADES_DTYPES = {
+    'filed_at_date': pl.Date,
+    'transaction_date': pl.Date,
+}
+_CONGRESS_TRADES_CASTS = _cast_exprs(_CONGRESS_TRADES_DTYPES, strict=False)
 
 @mcp.tool()
-def get_congress_trades(limit: int = 100, date: str = None, ticker: str = None) -> pl.DataFrame:
+async def get_congress_trades(limit: int = 100, date: str = None, ticker: str = None, columns: list[str] = None) -> pl.DataFrame:
     """
     Fetch recent trades reported by members of Congress from the Unusual Whales API.
     Args:
         limit (int): Maximum number of results to return (default 100, max 200).
         date (str): Optional market date (YYYY-MM-DD) to filter trades on or before this transaction date.
         ticker (str): Optional ticker symbol to filter trades by.
+        columns (list[str]): Optional list of columns to return, instead of all of them. Unknown names are skipped.
     Returns:
         pl.DataFrame: A Polars DataFrame containing recent Congress trades.
     """
-    url = 'https://api.unusualwhales.com/api/congress/recent-trades'
-    
-    default_values = get_congress_trades.__defaults__
-    param_names = get_congress_trades.__code__.co_varnames[:get_congress_trades.__code__.co_argcount]
-    defaults = dict(zip(param_names, default_values))
-    
-    frame = inspect.currentframe()
-    args = frame.f_locals
-    params = {
-        p_name: args[p_name] 
-        for p_name in param_names 
-        if p_name in args
-        and (args[p_name] is not None)
-        and (p_name not in defaults or args[p_name] != defaults[p_name])
-        and p_name not in ('url', 'frame')
-    }
-    del frame
+    url = '/api/congress/recent-trades'
+    params = _nondefault(locals(), _CONGRESS_TRADES_DEFAULTS)
+    df = await _fetch('congress_trades', url, _CONGRESS_TRADES_CASTS, params)
+    return _select_columns(df, columns)
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            rsp = client.get(url, params=params, headers=headers)
-            rsp.raise_for_status()
-            
-            data = rsp.json().get('data')
-            if not data:
-                return pl.DataFrame()
-            else:
-                df = pl.DataFrame(data)
-                # Apply type conversions based on the schema 'Senate Stock'
-                return (
-                    df
-                    .with_columns(
-                        pl.col('filed_at_date').cast(pl.Date, strict=False),
-                        pl.col('transaction_date').cast(pl.Date, strict=False),
-                    )
-                )
+_CONGRESS_TRADES_DEFAULTS = _signature_defaults(get_congress_trades, drop=('columns',))
 
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise ValueError('Invalid or missing API key')
-        elif e.response.status_code == 404:
-            raise ValueError(f'Resource not found: {e.response.text}')
-        elif e.response.status_code == 429:
-            raise ValueError('Rate limit exceeded')
-        else:
-            raise ValueError(f'HTTP error: {e.response.status_code} - {e.response.text}')
-    
-    except httpx.RequestError as e:
-        raise ConnectionError(f'Network error: {e.request.url} - {str(e)}')
-    
-    except httpx.TimeoutException:
-        raise TimeoutError('Request timed out')
-    except Exception as e: # Catch other potential errors during processing
-        logging.error(f"An unexpected error occurred in get_congress_trades: {e}")
-        raise
+_NEWS_HEADLINES_DTYPES = {
+    'created_at': pl.Datetime,
+    # meta is object, tags and tickers are arrays - handle if needed
+}
+_NEWS_HEADLINES_CASTS = _cast_exprs(_NEWS_HEADLINES_DTYPES, tz_cols=('created_at',), strict=False)
 
 @mcp.tool()
-def get_news_headlines(
+async def get_news_headlines(
     sources: str = None, 
     search_term: str = None, 
     major_only: bool = False, 
     limit: int = 50, 
-    page: int = 0
+    page: int = 0,
+    columns: list[str] = None
 ) -> pl.DataFrame:
     """
     Fetch recent financial news headlines from the Unusual Whales API.
@@ -570,65 +778,13 @@ def get_news_headlines(
         major_only (bool): If True, only return major/significant news (default False).
         limit (int): Maximum number of results to return (default 50, max 100).
         page (int): Page number for pagination (starts at 0).
+        columns (list[str]): Optional list of columns to return, instead of all of them. Unknown names are skipped.
     Returns:
         pl.DataFrame: A Polars DataFrame containing news headlines.
     """
-    url = 'https://api.unusualwhales.com/api/news/headlines'
-    
-    default_values = get_news_headlines.__defaults__
-    param_names = get_news_headlines.__code__.co_varnames[:get_news_headlines.__code__.co_argcount]
-    defaults = dict(zip(param_names, default_values))
-    
-    frame = inspect.currentframe()
-    args = frame.f_locals
-    params = {
-        p_name: args[p_name] 
-        for p_name in param_names 
-        if p_name in args
-        and (args[p_name] is not None)
-        and (p_name not in defaults or args[p_name] != defaults[p_name])
-        and p_name not in ('url', 'frame')
-    }
-    del frame
-
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            rsp = client.get(url, params=params, headers=headers)
-            rsp.raise_for_status()
-            
-            data = rsp.json().get('data')
-            if not data:
-                return pl.DataFrame()
-            else:
-                df = pl.DataFrame(data)
-                # Apply type conversions based on the schema 'Headline News'
-                return (
-                    df
-                    .with_columns(
-                        pl.col('created_at').cast(pl.Datetime, strict=False),
-                        # meta is object, tags and tickers are arrays - handle if needed
-                    )
-                     .with_columns(
-                        pl.col('created_at').dt.convert_time_zone('America/New_York')
-                    )
-                )
-
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise ValueError('Invalid or missing API key')
-        elif e.response.status_code == 404:
-            raise ValueError(f'Resource not found: {e.response.text}')
-        elif e.response.status_code == 429:
-            raise ValueError('Rate limit exceeded')
-        else:
-            raise ValueError(f'HTTP error: {e.response.status_code} - {e.response.text}')
-    
-    except httpx.RequestError as e:
-        raise ConnectionError(f'Network error: {e.request.url} - {str(e)}')
-    
-    except httpx.TimeoutException:
-        raise TimeoutError('Request timed out')
-    except Exception as e: # Catch other potential errors during processing
-        logging.error(f"An unexpected error occurred in get_news_headlines: {e}")
-        raise
+    url = '/api/news/headlines'
+    params = _nondefault(locals(), _NEWS_HEADLINES_DEFAULTS)
+    df = await _fetch('news_headlines', url, _NEWS_HEADLINES_CASTS, params)
+    return _select_columns(df, columns)
 
+_NEWS_HEADLINES_DEFAULTS = _signature_defaults(get_news_headlines, drop=('columns',))